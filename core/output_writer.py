@@ -10,9 +10,16 @@ from .image_utils import ImageRenderer
 class OutputWriter:
     """Writes tasks to standard folder structure."""
     
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, png_compress_level: int = 1):
+        """
+        Args:
+            output_dir: Root output directory
+            png_compress_level: zlib level for PNG frames (0-9). Low levels
+                trade a little disk space for much faster saves.
+        """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.png_compress_level = png_compress_level
     
     def write_task_pair(self, task_pair: TaskPair) -> Path:
         """Write single task to disk."""
@@ -20,10 +27,14 @@ class OutputWriter:
         task_dir.mkdir(parents=True, exist_ok=True)
         
         # Write images
-        ImageRenderer.ensure_rgb(task_pair.first_image).save(task_dir / "first_frame.png")
+        ImageRenderer.ensure_rgb(task_pair.first_image).save(
+            task_dir / "first_frame.png", "PNG", compress_level=self.png_compress_level
+        )
         
         if task_pair.final_image:
-            ImageRenderer.ensure_rgb(task_pair.final_image).save(task_dir / "final_frame.png")
+            ImageRenderer.ensure_rgb(task_pair.final_image).save(
+                task_dir / "final_frame.png", "PNG", compress_level=self.png_compress_level
+            )
         
         # Write prompt
         (task_dir / "prompt.txt").write_text(task_pair.prompt)
@@ -13,6 +13,7 @@ Usage:
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
@@ -78,7 +79,9 @@ Examples:
     
     # Write to disk
     writer = OutputWriter(Path(args.output))
-    writer.write_dataset(tasks)
+    # PIL releases the GIL while encoding PNGs, so overlap the task writes
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(writer.write_task_pair, tasks))
     
     print(f"✅ Done! Generated {len(tasks)} tasks in {args.output}/{config.domain}_task/")
 
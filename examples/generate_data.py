@@ -13,6 +13,7 @@ Usage:
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
@@ -110,7 +111,9 @@ Examples:
     # Write to disk
     print(f"💾 Writing {len(tasks)} tasks to disk...")
     writer = OutputWriter(Path(args.output))
-    writer.write_dataset(tasks)
+    # PIL releases the GIL while encoding PNGs, so overlap the task writes
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(writer.write_task_pair, tasks))
     
     # Summary
     print()
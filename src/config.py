@@ -7,6 +7,7 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+from typing import Optional
 from pydantic import Field
 from core import GenerationConfig
 
@@ -45,6 +46,11 @@ class TaskConfig(GenerationConfig):
         description="Video frame rate"
     )
     
+    video_hw_acceleration: bool = Field(
+        default=True,
+        description="Use a hardware video encoder when one is available (falls back to software)"
+    )
+    
     # ══════════════════════════════════════════════════════════════════════════
     #  TASK-SPECIFIC SETTINGS
     # ══════════════════════════════════════════════════════════════════════════
@@ -58,3 +64,12 @@ class TaskConfig(GenerationConfig):
         default=500,
         description="Clock image size (width and height)"
     )
+    
+    # ══════════════════════════════════════════════════════════════════════════
+    #  PERFORMANCE SETTINGS
+    # ══════════════════════════════════════════════════════════════════════════
+    
+    num_workers: Optional[int] = Field(
+        default=None,
+        description="Worker processes for balanced generation (None = all CPU cores, 1 = serial)"
+    )
@@ -8,16 +8,107 @@
 """
 
 import math
+import os
 import random
 import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Tuple, Optional
-from PIL import Image, ImageDraw, ImageFont
+from typing import List, NamedTuple, Tuple, Optional
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 
 from core import BaseGenerator, TaskPair
-from core.video_utils import VideoGenerator
+from core.video_utils import VideoGenerator, cv2
 from .config import TaskConfig
-from .prompts import get_prompt
+from .prompts import PROMPTS, get_prompt
+
+
+def _draw_line_np(arr: np.ndarray, x0: int, y0: int, x1: int, y1: int,
+                  width: int, color: Tuple[int, int, int]):
+    """
+    Rasterize a thick line directly into an (H, W, 3) uint8 array
+    
+    Samples one point per pixel along the line and stamps a round brush of
+    diameter `width` at every sample, all in a single fancy-index assignment.
+    
+    Args:
+        arr: Target RGB array (modified in place)
+        x0, y0: Start point
+        x1, y1: End point
+        width: Line width in pixels
+        color: RGB color tuple
+    """
+    steps = max(abs(x1 - x0), abs(y1 - y0)) + 1
+    t = np.linspace(0.0, 1.0, steps)
+    xs = x0 + t * (x1 - x0)
+    ys = y0 + t * (y1 - y0)
+    
+    # Brush footprint: pixel offsets inside a disk of diameter `width`
+    offsets = np.arange(width) - (width - 1) / 2.0
+    dx, dy = np.meshgrid(offsets, offsets)
+    inside = dx ** 2 + dy ** 2 <= (width / 2.0) ** 2
+    dx, dy = dx[inside], dy[inside]
+    
+    px = np.floor(xs[:, None] + dx[None, :] + 0.5).astype(int).ravel()
+    py = np.floor(ys[:, None] + dy[None, :] + 0.5).astype(int).ravel()
+    height, img_width = arr.shape[:2]
+    valid = (px >= 0) & (px < img_width) & (py >= 0) & (py < height)
+    arr[py[valid], px[valid]] = color
+
+
+def _crossfade_np(a_arr: np.ndarray, b_arr: np.ndarray, n: int) -> np.ndarray:
+    """
+    Build an n-frame linear crossfade from a_arr to b_arr
+    
+    The difference image is computed once and each frame is written into a
+    preallocated uint8 buffer, so no (n, H, W, 3) float temporaries exist.
+    
+    Args:
+        a_arr: Start frame as an (H, W, 3) uint8 RGB array
+        b_arr: End frame (same shape as a_arr)
+        n: Number of frames, including both endpoints
+        
+    Returns:
+        (n, H, W, 3) uint8 array of RGB frames
+    """
+    diff = b_arr.astype(np.float32) - a_arr
+    frame = np.empty(diff.shape, dtype=np.float32)
+    out = np.empty((n,) + a_arr.shape, dtype=np.uint8)
+    for i, alpha in enumerate(np.linspace(0, 1, n, dtype=np.float32)):
+        np.multiply(diff, alpha, out=frame)
+        frame += a_arr
+        out[i] = frame
+    return out
+
+
+def _write_rgb_frames(writer, frames: np.ndarray, repeat: int = 1):
+    """
+    Write RGB frames to a cv2.VideoWriter
+    
+    Args:
+        writer: Open cv2.VideoWriter
+        frames: One (H, W, 3) uint8 frame or an (N, H, W, 3) batch
+        repeat: Number of times to write each frame (e.g. for holds)
+    """
+    if frames.ndim == 3:
+        frames = frames[None]
+    for frame in frames:
+        # Convert once per distinct frame; repeated holds reuse it
+        frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+        for _ in range(repeat):
+            writer.write(frame_bgr)
+
+
+class TaskParams(NamedTuple):
+    """Random choices that fully determine one task"""
+    difficulty: str
+    hours: int
+    minutes: int
+    add_hours: int
+    add_minutes: int
+    prompt_index: int
 
 
 class ClockRenderer:
@@ -35,6 +126,50 @@ class ClockRenderer:
         self.clock_radius = int(image_size * 0.4)
         self.hour_hand_length = int(self.clock_radius * 0.5)
         self.minute_hand_length = int(self.clock_radius * 0.7)
+        
+        # Load the font and measure every hour label once
+        self._font = self._load_font(int(image_size * 0.07))  # Responsive font size
+        self._hour_label_offsets = []
+        for hour in range(1, 13):
+            hour_str = str(hour)
+            bbox = self._font.getbbox(hour_str)
+            text_width = bbox[2] - bbox[0]
+            text_height = bbox[3] - bbox[1]
+            self._hour_label_offsets.append((hour_str, text_width // 2, text_height // 2))
+        
+        # cos/sin for every tenth of a degree of hand angle (0 = 12 o'clock,
+        # clockwise). Hand angles are multiples of 0.5 degrees, so table
+        # lookups are exact.
+        lut_angles = np.deg2rad(np.arange(3600) / 10.0 - 90)
+        self._cos_lut = np.cos(lut_angles).tolist()
+        self._sin_lut = np.sin(lut_angles).tolist()
+        
+        # The face (circle, numbers, center dot) never changes, so render it
+        # once and only rasterize the hands per clock
+        self._face_template = self._render_face_template()
+    
+    @staticmethod
+    def _load_font(font_size: int) -> ImageFont.ImageFont:
+        """Try to load a nice font, falling back to PIL's default"""
+        try:
+            # Try system fonts
+            return ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
+        except OSError:
+            try:
+                return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
+            except OSError:
+                return ImageFont.load_default()
+    
+    def _render_face_template(self) -> np.ndarray:
+        """
+        Render the static clock face once as an (H, W, 3) uint8 array
+        
+        The array is a read-only view over the image's raw RGB bytes, so
+        each clock starts with a single contiguous memcpy of it.
+        """
+        img = Image.new('RGB', (self.image_size, self.image_size), color='white')
+        self._draw_clock_face(ImageDraw.Draw(img))
+        return np.asarray(img)
     
     def _draw_clock_face(self, draw: ImageDraw.Draw):
         """Draw the basic clock face with numbers"""
@@ -51,33 +186,17 @@ class ClockRenderer:
             fill='#ffffff'
         )
         
-        # Try to load a nice font
-        font_size = int(self.image_size * 0.07)  # Responsive font size
-        try:
-            # Try system fonts
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
-        except:
-            try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
-            except:
-                font = ImageFont.load_default()
-        
         # Draw hour numbers
-        for hour in range(1, 13):
+        for hour, (hour_str, dx, dy) in enumerate(self._hour_label_offsets, 1):
             angle = math.radians(90 - (hour * 30))  # 12 is at top (90 degrees)
             x = self.center + int((self.clock_radius * 0.75) * math.cos(angle))
             y = self.center - int((self.clock_radius * 0.75) * math.sin(angle))
             
-            hour_str = str(hour)
-            bbox = draw.textbbox((0, 0), hour_str, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-            
             draw.text(
-                (x - text_width // 2, y - text_height // 2),
+                (x - dx, y - dy),
                 hour_str,
                 fill='#333333',
-                font=font
+                font=self._font
             )
         
         # Draw center dot
@@ -92,28 +211,26 @@ class ClockRenderer:
             fill='#333333'
         )
     
-    def _draw_hand(self, draw: ImageDraw.Draw, angle_degrees: float,
+    def _draw_hand(self, arr: np.ndarray, angle_degrees: float,
                    length: int, width: int, color: str):
         """
         Draw a clock hand
         
         Args:
+            arr: RGB array to draw on
             angle_degrees: Angle in degrees (0 = 12 o'clock, clockwise)
             length: Length of the hand
             width: Width of the hand
             color: Color of the hand
         """
-        # Convert to radians (subtract 90 to make 0 degrees point up)
-        angle_rad = math.radians(angle_degrees - 90)
+        # Look up the direction (the tables already make 0 degrees point up)
+        idx = int(round(angle_degrees * 10)) % 3600
         
-        end_x = self.center + int(length * math.cos(angle_rad))
-        end_y = self.center + int(length * math.sin(angle_rad))
+        end_x = self.center + int(length * self._cos_lut[idx])
+        end_y = self.center + int(length * self._sin_lut[idx])
         
-        draw.line(
-            [self.center, self.center, end_x, end_y],
-            fill=color,
-            width=width
-        )
+        _draw_line_np(arr, self.center, self.center, end_x, end_y,
+                      width, ImageColor.getrgb(color))
     
     def draw_clock(self, hours: int, minutes: int) -> Image.Image:
         """
@@ -126,12 +243,21 @@ class ClockRenderer:
         Returns:
             PIL Image of the clock
         """
-        # Create image
-        img = Image.new('RGB', (self.image_size, self.image_size), color='white')
-        draw = ImageDraw.Draw(img)
+        return Image.fromarray(self.draw_clock_array(hours, minutes))
+    
+    def draw_clock_array(self, hours: int, minutes: int) -> np.ndarray:
+        """
+        Draw a clock showing the specified time as a NumPy array
         
-        # Draw clock face
-        self._draw_clock_face(draw)
+        Args:
+            hours: Hour (0-23, will be converted to 12-hour)
+            minutes: Minutes (0-59)
+            
+        Returns:
+            (H, W, 3) uint8 RGB array of the clock
+        """
+        # Start from a copy of the pre-rendered clock face
+        arr = self._face_template.copy()
         
         # Convert to 12-hour format
         hours_12 = hours % 12
@@ -144,10 +270,10 @@ class ClockRenderer:
         
         # Draw hands (minute hand first, then hour hand on top)
         hand_width = max(3, int(self.image_size * 0.012))
-        self._draw_hand(draw, minute_angle, self.minute_hand_length, hand_width, '#666666')
-        self._draw_hand(draw, hour_angle, self.hour_hand_length, hand_width + 2, '#333333')
+        self._draw_hand(arr, minute_angle, self.minute_hand_length, hand_width, '#666666')
+        self._draw_hand(arr, hour_angle, self.hour_hand_length, hand_width + 2, '#333333')
         
-        return img
+        return arr
 
 
 class TaskGenerator(BaseGenerator):
@@ -167,52 +293,58 @@ class TaskGenerator(BaseGenerator):
         
         # Initialize video generator if enabled
         self.video_generator = None
+        self._submit_video = None  # Set while _pipelined_videos() is active
         if config.generate_videos and VideoGenerator.is_available():
             self.video_generator = VideoGenerator(fps=config.video_fps, output_format="mp4")
+            self._writer_params = self._video_writer_params()
+            # Every clip of this generator goes to the same temp directory
+            self._video_dir = Path(tempfile.gettempdir()) / f"{config.domain}_videos"
     
-    def generate_task_pair(self, task_id: str) -> TaskPair:
-        """Generate one mirror clock task pair."""
-        
-        # Determine difficulty if not specified
-        difficulty = self.config.difficulty
-        if difficulty is None:
-            difficulty = random.choice(["easy", "medium", "hard"])
-        
-        # Generate random time based on difficulty
-        hours, minutes = self._generate_random_time(difficulty)
+    def generate_task_pair(self, task_id: str, params: Optional[TaskParams] = None) -> TaskPair:
+        """
+        Generate one mirror clock task pair.
         
-        # Generate time delta to add
-        add_hours, add_minutes = self._generate_time_delta(difficulty)
+        Args:
+            task_id: Task ID
+            params: Pre-drawn task parameters; drawn at random if None
+        """
+        if params is None:
+            params = self._random_task_params()
+        _, hours, minutes, add_hours, add_minutes, prompt_index = params
         
         # Calculate future time
         future_hours, future_minutes = self._add_time(hours, minutes, add_hours, add_minutes)
         
         # Generate original clock image
-        original_image = self.clock_renderer.draw_clock(hours, minutes)
+        original_arr = self.clock_renderer.draw_clock_array(hours, minutes)
         
-        # Create mirrored version by flipping horizontally (first frame)
-        mirrored_image = original_image.transpose(Image.FLIP_LEFT_RIGHT)
+        # Create mirrored version by flipping horizontally (first frame).
+        # PIL's transpose is a fast contiguous flip; a reversed-stride NumPy
+        # view would need a slower strided copy before anything could use it.
+        mirrored_image = Image.fromarray(original_arr).transpose(Image.FLIP_LEFT_RIGHT)
         
         # Generate future clock image (final frame)
-        future_image = self.clock_renderer.draw_clock(future_hours, future_minutes)
+        future_arr = self.clock_renderer.draw_clock_array(future_hours, future_minutes)
         
         # Generate video if enabled
         video_path = None
         if self.config.generate_videos and self.video_generator:
-            video_path = self._generate_video(mirrored_image, future_image, task_id, original_image)
+            video_path = self._generate_video(
+                np.asarray(mirrored_image), future_arr, task_id, original_arr
+            )
         
         # Format time delta string for prompt
         time_delta_str = self._format_time_delta(add_hours, add_minutes)
         
         # Select prompt
-        prompt = get_prompt(time_delta_str)
+        prompt = get_prompt(time_delta_str, prompt_index)
         
         return TaskPair(
             task_id=task_id,
             domain=self.config.domain,
             prompt=prompt,
             first_image=mirrored_image,
-            final_image=future_image,
+            final_image=Image.fromarray(future_arr),
             ground_truth_video=video_path
         )
     
@@ -220,12 +352,30 @@ class TaskGenerator(BaseGenerator):
     #  VIDEO GENERATION
     # ══════════════════════════════════════════════════════════════════════════
     
+    def _video_writer_params(self) -> List[int]:
+        """
+        Build cv2.VideoWriter parameters for the ground truth videos
+        
+        GOP structure is not tuned here: OpenCV's FFmpeg writer already
+        encodes mp4v without B-frames and with a single reference frame, and
+        VIDEOWRITER_PROP_KEY_INTERVAL only applies to raw-video output.
+        
+        Returns:
+            Flat [prop_id, value, ...] list
+        """
+        params = []
+        if getattr(self.config, 'video_hw_acceleration', False):
+            # Offload encoding to a GPU encoder when OpenCV's FFmpeg backend
+            # finds one; otherwise OpenCV silently uses the software encoder
+            params += [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+        return params
+    
     def _generate_video(
         self,
-        first_image: Image.Image,
-        final_image: Image.Image,
+        first_frame: np.ndarray,
+        final_frame: np.ndarray,
         task_id: str,
-        original_image: Image.Image
+        original_frame: np.ndarray
     ) -> Optional[str]:
         """
         Generate ground truth video showing step-by-step reasoning process.
@@ -236,10 +386,10 @@ class TaskGenerator(BaseGenerator):
         3. Show future clock (final answer)
         
         Args:
-            first_image: Mirrored clock image (start frame)
-            final_image: Future clock image (end frame)
+            first_frame: Mirrored clock RGB array (start frame)
+            final_frame: Future clock RGB array (end frame)
             task_id: Task ID for naming the video file
-            original_image: Original clock image (unmirrored, intermediate step)
+            original_frame: Original clock RGB array (unmirrored, intermediate step)
             
         Returns:
             Path to video file, or None if generation fails
@@ -247,56 +397,166 @@ class TaskGenerator(BaseGenerator):
         if not self.video_generator:
             return None
         
-        # Create temporary directory for videos
-        temp_dir = Path(tempfile.gettempdir()) / f"{self.config.domain}_videos"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        video_path = temp_dir / f"{task_id}_ground_truth.mp4"
-        
-        # Generate step-by-step video frames
-        frames = []
-        
-        # Step 1: Hold mirrored clock (first frame) - 15 frames
-        for _ in range(15):
-            frames.append(first_image.copy())
-        
-        # Step 2: Transition from mirrored to original clock - 20 frames
-        mirrored_rgba = first_image.convert('RGBA')
-        original_rgba = original_image.convert('RGBA')
-        if mirrored_rgba.size != original_rgba.size:
-            original_rgba = original_rgba.resize(mirrored_rgba.size, Image.Resampling.LANCZOS)
-        
-        for i in range(20):
-            alpha = i / (20 - 1) if 20 > 1 else 1.0
-            blended = Image.blend(mirrored_rgba, original_rgba, alpha)
-            frames.append(blended.convert('RGB'))
+        video_path = self._video_dir / f"{task_id}_ground_truth.mp4"
         
-        # Hold original clock - 15 frames (showing reasoning step)
-        for _ in range(15):
-            frames.append(original_image.copy())
+        if self._submit_video is not None:
+            # Encoded in the background; the path is resolved by _pipelined_videos()
+            self._submit_video(
+                task_id, self._encode_video, video_path, first_frame, final_frame, original_frame
+            )
+            return str(video_path)
         
-        # Step 3: Transition from original to future clock - 20 frames
-        future_rgba = final_image.convert('RGBA')
-        if original_rgba.size != future_rgba.size:
-            future_rgba = future_rgba.resize(original_rgba.size, Image.Resampling.LANCZOS)
+        return self._encode_video(video_path, first_frame, final_frame, original_frame)
+    
+    def _encode_video(
+        self,
+        video_path: Path,
+        first_frame: np.ndarray,
+        final_frame: np.ndarray,
+        original_frame: np.ndarray
+    ) -> Optional[str]:
+        """Encode the ground truth video frames (see _generate_video)"""
+        # Stream frames to the encoder as they are produced instead of
+        # collecting the whole clip in memory first
+        video_path = Path(video_path).with_suffix(self.video_generator.extension)
+        video_path.parent.mkdir(parents=True, exist_ok=True)
+        height, width = first_frame.shape[:2]
+        writer = cv2.VideoWriter(
+            str(video_path),
+            cv2.VideoWriter_fourcc(*self.video_generator.codec),
+            self.video_generator.fps,
+            (width, height),
+            self._writer_params
+        )
+        try:
+            # Step 1: Hold mirrored clock (first frame) - 15 frames
+            _write_rgb_frames(writer, first_frame, repeat=15)
+            
+            # Step 2: Transition from mirrored to original clock - 20 frames
+            _write_rgb_frames(writer, _crossfade_np(first_frame, original_frame, 20))
+            
+            # Hold original clock - 15 frames (showing reasoning step)
+            _write_rgb_frames(writer, original_frame, repeat=15)
+            
+            # Step 3: Transition from original to future clock - 20 frames
+            _write_rgb_frames(writer, _crossfade_np(original_frame, final_frame, 20))
+            
+            # Hold future clock (final frame) - 15 frames
+            _write_rgb_frames(writer, final_frame, repeat=15)
+        finally:
+            writer.release()
         
-        for i in range(20):
-            alpha = i / (20 - 1) if 20 > 1 else 1.0
-            blended = Image.blend(original_rgba, future_rgba, alpha)
-            frames.append(blended.convert('RGB'))
+        return str(video_path) if video_path.exists() else None
+    
+    @contextmanager
+    def _pipelined_videos(self):
+        """
+        Encode videos on background threads for the duration of the block
         
-        # Hold future clock (final frame) - 15 frames
-        for _ in range(15):
-            frames.append(final_image.copy())
+        OpenCV releases the GIL while encoding, so the next task's clocks
+        render while earlier videos are still being written. The number of
+        queued videos is bounded to keep memory flat.
         
-        # Create video from frames
-        result = self.video_generator.create_video_from_frames(frames, video_path)
+        Yields:
+            Dict mapping task_id to video path (or None on failure), filled
+            in once every encode has finished at block exit
+        """
+        encoders = min(4, os.cpu_count() or 1)
+        slots = threading.BoundedSemaphore(2 * encoders)
+        futures = {}
+        videos = {}
+        
+        with ThreadPoolExecutor(max_workers=encoders) as executor:
+            def submit(task_id, fn, *args):
+                slots.acquire()
+                future = executor.submit(fn, *args)
+                future.add_done_callback(lambda _: slots.release())
+                futures[task_id] = future
+            
+            self._submit_video = submit
+            try:
+                yield videos
+            finally:
+                self._submit_video = None
         
-        return str(result) if result else None
+        videos.update({task_id: future.result() for task_id, future in futures.items()})
     
     # ══════════════════════════════════════════════════════════════════════════
     #  TIME GENERATION METHODS
     # ══════════════════════════════════════════════════════════════════════════
     
+    def _random_task_params(self) -> TaskParams:
+        """Draw parameters for a single task using the `random` module"""
+        # Determine difficulty if not specified
+        difficulty = self.config.difficulty
+        if difficulty is None:
+            difficulty = random.choice(["easy", "medium", "hard"])
+        
+        # Generate random time based on difficulty
+        hours, minutes = self._generate_random_time(difficulty)
+        
+        # Generate time delta to add
+        add_hours, add_minutes = self._generate_time_delta(difficulty)
+        
+        prompt_index = random.randrange(len(PROMPTS))
+        return TaskParams(difficulty, hours, minutes, add_hours, add_minutes, prompt_index)
+    
+    def _draw_task_params(self, difficulties: List[str]) -> List[TaskParams]:
+        """
+        Draw parameters for a whole dataset in one batch
+        
+        Mirrors the per-difficulty rules of _generate_random_time and
+        _generate_time_delta, vectorized over all tasks.
+        
+        Args:
+            difficulties: Difficulty of each task
+            
+        Returns:
+            One TaskParams per task
+        """
+        rng = np.random.default_rng(self.config.random_seed)
+        n = len(difficulties)
+        levels = np.array(difficulties, dtype=str)
+        easy = levels == "easy"
+        medium = levels == "medium"
+        hard = ~(easy | medium)
+        
+        hours = rng.integers(1, 13, size=n)
+        minutes = np.select(
+            [easy, medium],
+            [0, rng.integers(0, 12, size=n) * 5],
+            default=rng.integers(0, 60, size=n)
+        )
+        add_hours = np.select(
+            [easy, medium],
+            [rng.integers(1, 4, size=n), rng.integers(0, 3, size=n)],
+            default=rng.integers(0, 4, size=n)
+        )
+        add_minutes = np.select(
+            [easy, medium],
+            [0, rng.integers(0, 2, size=n) * 30],
+            default=rng.integers(0, 60, size=n)
+        )
+        
+        # Ensure at least some time is added
+        no_delta = (add_hours == 0) & (add_minutes == 0)
+        add_hours = np.where(no_delta & medium, 1, add_hours)
+        add_minutes = np.where(no_delta & hard, rng.integers(15, 46, size=n), add_minutes)
+        
+        prompt_indices = rng.integers(0, len(PROMPTS), size=n)
+        
+        return [
+            TaskParams(*row)
+            for row in zip(
+                difficulties,
+                hours.tolist(),
+                minutes.tolist(),
+                add_hours.tolist(),
+                add_minutes.tolist(),
+                prompt_indices.tolist()
+            )
+        ]
+    
     def _generate_random_time(self, difficulty: str) -> Tuple[int, int]:
         """
         Generate a random time based on difficulty
@@ -396,8 +656,10 @@ class TaskGenerator(BaseGenerator):
         """Generate dataset with optional balanced difficulty distribution"""
         if hasattr(self.config, 'balanced_difficulty') and self.config.balanced_difficulty:
             return self._generate_balanced_dataset()
-        else:
-            return super().generate_dataset()
+        
+        with self._pipelined_videos() as videos:
+            pairs = super().generate_dataset()
+        return _attach_videos(pairs, videos)
     
     def _generate_balanced_dataset(self):
         """Generate balanced dataset across difficulty levels"""
@@ -405,25 +667,65 @@ class TaskGenerator(BaseGenerator):
         samples_per_difficulty = self.config.num_samples // len(difficulties)
         remaining = self.config.num_samples % len(difficulties)
         
-        pairs = []
-        task_counter = 0
-        
+        task_difficulties = []
         for difficulty in difficulties:
             count = samples_per_difficulty + (1 if remaining > 0 else 0)
             remaining -= 1
-            
-            # Temporarily set difficulty
-            original_difficulty = self.config.difficulty
-            self.config.difficulty = difficulty
-            
-            for i in range(count):
-                task_id = f"{self.config.domain}_{task_counter:04d}"
-                pair = self.generate_task_pair(task_id)
+            task_difficulties.extend([difficulty] * count)
+        
+        # Work list of (task_id, params), with all random choices made up front
+        work_items = [
+            (f"{self.config.domain}_{i:04d}", params)
+            for i, params in enumerate(self._draw_task_params(task_difficulties))
+        ]
+        
+        num_workers = self.config.num_workers or os.cpu_count() or 1
+        num_workers = min(num_workers, len(work_items))
+        
+        pairs = []
+        if num_workers <= 1:
+            with self._pipelined_videos() as videos:
+                for task_id, params in work_items:
+                    pairs.append(self.generate_task_pair(task_id, params))
+                    print(f"  Generated: {task_id} (difficulty: {params.difficulty})")
+            return _attach_videos(pairs, videos)
+        
+        # Tasks are independent, so fan them out across processes
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_worker,
+            initargs=(self.config,)
+        ) as executor:
+            results = executor.map(_generate_task_in_worker, work_items, chunksize=4)
+            for (task_id, params), pair in zip(work_items, results):
                 pairs.append(pair)
-                print(f"  Generated: {task_id} (difficulty: {difficulty})")
-                task_counter += 1
-            
-            # Restore original difficulty
-            self.config.difficulty = original_difficulty
+                print(f"  Generated: {task_id} (difficulty: {params.difficulty})")
         
         return pairs
+
+
+def _attach_videos(pairs: List[TaskPair], videos: dict) -> List[TaskPair]:
+    """Fill in video paths resolved by TaskGenerator._pipelined_videos()"""
+    for pair in pairs:
+        if pair.task_id in videos:
+            pair.ground_truth_video = videos[pair.task_id]
+    return pairs
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  PROCESS POOL WORKERS
+# ══════════════════════════════════════════════════════════════════════════════
+
+# Generator owned by the current worker process (set by _init_worker)
+_worker_generator: Optional[TaskGenerator] = None
+
+
+def _init_worker(config: TaskConfig):
+    """Build the worker process's TaskGenerator once"""
+    global _worker_generator
+    _worker_generator = TaskGenerator(config)
+
+
+def _generate_task_in_worker(item: Tuple[str, TaskParams]) -> TaskPair:
+    """Generate one (task_id, params) work item in a worker"""
+    return _worker_generator.generate_task_pair(*item)
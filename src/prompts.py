@@ -8,6 +8,7 @@
 """
 
 import random
+from typing import Optional
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -40,19 +41,24 @@ Step 3: Add {time_delta} to the original time.
 What is the result?""",
 ]
 
+# Literal text around each {time_delta} placeholder, split once at import so
+# get_prompt can fill templates with str.join instead of str.format
+_PROMPT_PARTS = [template.split("{time_delta}") for template in PROMPTS]
 
-def get_prompt(time_delta: str = "1 hour") -> str:
+
+def get_prompt(time_delta: str = "1 hour", index: Optional[int] = None) -> str:
     """
-    Select a random prompt and fill in the time_delta placeholder.
+    Select a prompt and fill in the time_delta placeholder.
     
     Args:
         time_delta: Time delta string (e.g., "2 hours", "1 hour and 30 minutes")
+        index: Index of the template in PROMPTS (random if None)
         
     Returns:
         Formatted prompt string
     """
-    prompt_template = random.choice(PROMPTS)
-    return prompt_template.format(time_delta=time_delta)
+    parts = random.choice(_PROMPT_PARTS) if index is None else _PROMPT_PARTS[index]
+    return time_delta.join(parts)
 
 
 def get_all_prompts() -> list[str]: